@@ -17,10 +17,17 @@ from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, HRFlowable
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+from curl_cffi import requests as curl_requests
 import requests
 import os
 import json
+import pickle
+import time
 
 
 # ─── Configuration ───────────────────────────────────────────────────────────
@@ -88,19 +95,17 @@ WTI_TICKERS = [
     ("CL=F", "WTI Crude Oil"),
 ]
 
+# Yield tickers in bond table order; Japan 10Y has no reliable Yahoo ticker
 BOND_TICKERS = [
-    ("^IRX",  "US 3-Month T-Bill"),
-    ("2YY=F", "US 2-Year Yield"),
-    ("^TNX",  "US 10-Year Yield"),
-    ("^TYX",  "US 30-Year Yield"),
+    ("2YY=F", "US 2-Year"),
+    ("^TNX",  "US 10-Year"),
+    ("^TYX",  "US 30-Year"),
 ]
 
-# Japan 10Y and metals don't have reliable Yahoo tickers; we use proxies
-EXTRA_TICKERS = [
-    ("GC=F",  "Gold Futures"),
-    ("SI=F",  "Silver Futures"),
-    ("GLD",   "SPDR Gold ETF"),
-    ("SLV",   "iShares Silver ETF"),
+# Spot metals via front-month futures
+METAL_TICKERS = [
+    ("GC=F",  "Gold"),
+    ("SI=F",  "Silver"),
 ]
 
 # Standard CME futures month codes
@@ -109,6 +114,8 @@ MONTH_CODES = {
     7: 'N', 8: 'Q', 9: 'U', 10: 'V', 11: 'X', 12: 'Z',
 }
 
+# Trading days back per return column; the 3Y lookback sets how much
+# history fetch_close_prices() has to download
 LOOKBACK_PERIODS = {
     "1D":  1,
     "1W":  5,
@@ -118,54 +125,145 @@ LOOKBACK_PERIODS = {
     "1Y":  252,
     "3Y":  756,
 }
+RETURN_COLS = list(LOOKBACK_PERIODS)
+
+# Calendar days of history to download: the 3Y lookback plus a holiday buffer
+HISTORY_DAYS = 4 * 365 + 1
+
+# Bound str.format methods for the per-cell hot paths; the format spec is parsed once
+PRICE_FMT = "${:,.2f}".format
+PCT_FMT = "{:+.2%}".format
+
+# Every symbol in the report, pulled by the single batched download in main()
+ALL_SYMBOLS = [s for s, _ in (
+    EQUITY_TICKERS + MAG7_TICKERS + DEFENSE_TICKERS + GLOBAL_INDEX_TICKERS
+    + CURRENCY_TICKERS + CRYPTO_TICKERS + WTI_TICKERS + BOND_TICKERS + METAL_TICKERS
+)]
+
+# Concurrent Ticker.history() fetches in main(); both are I/O-bound
+FETCH_WORKERS = 2
+
+# Per-symbol request threads inside the batched yf.download
+DOWNLOAD_THREADS = 8
+
+# One HTTP session shared by every Yahoo call, so TLS connections and the
+# Yahoo cookie/crumb are set up once per run instead of once per request
+SESSION = curl_requests.Session(impersonate="chrome")
+
+# Same-day on-disk cache of fetched data, so reruns skip the network
+CACHE_DIR = os.environ.get("MARKET_CACHE_DIR", ".yf_cache")
+CACHE_TTL = int(os.environ.get("MARKET_CACHE_TTL", 3600))  # seconds; 0 forces a refetch
 
 
 # ─── Data Fetching ───────────────────────────────────────────────────────────
 
-def fetch_returns(tickers_with_names, period="5y"):
-    """Fetch historical prices and compute returns for multiple timeframes."""
-    symbols = [t[0] for t in tickers_with_names]
-    names = {t[0]: t[1] for t in tickers_with_names}
+def cached_fetch(name, fetch, is_complete=len):
+    """Call fetch(), reusing today's on-disk result if younger than CACHE_TTL.
 
+    Only results that pass is_complete are written, so a partial fetch is
+    retried on the next run instead of being replayed from disk.
+    """
+    path = os.path.join(CACHE_DIR, f"{name}_{datetime.utcnow().strftime('%Y%m%d')}.pkl")
     try:
-        data = yf.download(symbols, period=period, auto_adjust=True, progress=False)
+        fresh = time.time() - os.path.getmtime(path) < CACHE_TTL
+    except OSError:
+        fresh = False
+    if fresh:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:  # truncated, or written by another pandas/numpy version
+            print(f"Discarding unreadable cache {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    result = fetch()
+    if result is not None and is_complete(result):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(result, f)
+        except OSError as e:
+            print(f"Cache write failed for {name}: {e}")
+    return result
+
+
+def close_is_complete(close):
+    """True if every report symbol has at least one price in the close frame."""
+    return bool(close.reindex(columns=ALL_SYMBOLS).notna().any().all())
+
+
+def fetch_close_prices(symbols=ALL_SYMBOLS, history_days=HISTORY_DAYS):
+    """Download closing prices for all symbols in one batched request."""
+    # An explicit start date, since "4y" is not a standard Yahoo range
+    start = (datetime.utcnow() - timedelta(days=history_days)).strftime("%Y-%m-%d")
+    try:
+        data = yf.download(symbols, start=start, auto_adjust=True, progress=False,
+                           threads=min(len(symbols), DOWNLOAD_THREADS), group_by="column",
+                           session=SESSION)
         if data.empty:
             return pd.DataFrame()
-        close = data["Close"] if "Close" in data.columns.get_level_values(0) else data
+        close = data["Close"] if "Close" in data.columns else data
     except Exception as e:
-        print(f"Error fetching {symbols}: {e}")
+        print(f"Error fetching {len(symbols)} symbols: {e}")
         return pd.DataFrame()
 
     if isinstance(close, pd.Series):
         close = close.to_frame(name=symbols[0])
+    return close
 
-    results = []
-    for sym in symbols:
-        if sym not in close.columns:
-            continue
-        series = close[sym].dropna()
-        if len(series) < 2:
-            continue
 
-        latest = series.iloc[-1]
-        row = {"Ticker": sym, "Name": names.get(sym, sym), "Price": latest}
+def pack_prices(close, symbols):
+    """Return close[symbols] as an ndarray with each column's valid prices moved
+    to the bottom (order kept), plus each column's number of valid prices.
 
-        for label, days in LOOKBACK_PERIODS.items():
-            if len(series) > days:
-                past = series.iloc[-(days + 1)]
-                row[label] = (latest - past) / past
-            else:
-                row[label] = None
+    Row -(d+1) is then d trading days back for every symbol, whatever its
+    calendar, without a per-symbol dropna() copy.
+    """
+    prices = close[symbols].to_numpy(dtype=float)
+    valid = ~np.isnan(prices)
+    order = np.argsort(valid, axis=0, kind="stable")
+    return np.take_along_axis(prices, order, axis=0), valid.sum(axis=0)
 
-        results.append(row)
 
-    return pd.DataFrame(results)
+def days_back(packed, n_obs, days):
+    """Each column's value `days` observations before its latest; NaN if too short."""
+    past = np.full(packed.shape[1], np.nan)
+    has_history = n_obs > days
+    if has_history.any():
+        past[has_history] = packed[-(days + 1), has_history]
+    return past
+
+
+def fetch_returns(tickers_with_names, close):
+    """Compute returns for multiple timeframes from pre-fetched closing prices."""
+    names = dict(tickers_with_names)
+    symbols = [sym for sym in names if sym in close.columns]
+    if not symbols:
+        return pd.DataFrame()
+
+    packed, n_obs = pack_prices(close, symbols)
+    latest = packed[-1]
+    returns = {}
+    for label, days in LOOKBACK_PERIODS.items():
+        past = days_back(packed, n_obs, days)
+        returns[label] = (latest - past) / past
+
+    df = pd.DataFrame({
+        "Ticker": symbols,
+        "Name": [names[s] for s in symbols],
+        "Price": latest,
+        **returns,
+    })
+    return df[n_obs >= 2].reset_index(drop=True)
 
 
 def fetch_vix_data():
     """Fetch VIX index: close, intraday high/low, 52-week high/low."""
     try:
-        hist = yf.Ticker("^VIX").history(period="1y")
+        hist = yf.Ticker("^VIX", session=SESSION).history(period="1y")
         if hist.empty:
             return None
         latest = hist.iloc[-1]
@@ -183,8 +281,8 @@ def fetch_vix_data():
         return None
 
 
-def fetch_wti_futures():
-    """Fetch WTI crude spot (CL=F) + next 2 calendar month futures."""
+def wti_futures_contracts():
+    """WTI crude spot (CL=F) + next 2 calendar month futures, as (ticker, label)."""
     now = datetime.utcnow()
 
     contracts = [("CL=F", "Spot / Front Month")]
@@ -197,11 +295,15 @@ def fetch_wti_futures():
         ticker = f"CL{MONTH_CODES[m]}{str(y)[-2:]}.NYM"
         label = datetime(y, m, 1).strftime("%b %Y") + " Futures"
         contracts.append((ticker, label))
+    return contracts
+
 
+def fetch_wti_futures():
+    """Fetch WTI crude spot (CL=F) + next 2 calendar month futures."""
     results = []
-    for ticker, label in contracts:
+    for ticker, label in wti_futures_contracts():
         try:
-            hist = yf.Ticker(ticker).history(period="5d")
+            hist = yf.Ticker(ticker, session=SESSION).history(period="5d")
             if hist.empty:
                 continue
             s = hist["Close"].dropna()
@@ -223,112 +325,267 @@ def fetch_wti_futures():
     return results
 
 
-def fetch_bond_yields():
-    """Fetch bond yield proxies and compute daily changes."""
-    symbols = ["^TNX", "^TYX", "^IRX"]
-    try:
-        data = yf.download(symbols, period="1y", auto_adjust=True, progress=False)
-        if data.empty:
-            return []
-        close = data["Close"]
-    except Exception:
-        return []
+def wti_futures_is_complete(results):
+    """True when every contract in the chain was fetched."""
+    return len(results) == len(wti_futures_contracts())
 
-    try:
-        two_yr = yf.download("2YY=F", period="1y", auto_adjust=True, progress=False)
-        two_yr_close = two_yr["Close"] if not two_yr.empty else None
-    except Exception:
-        two_yr_close = None
 
-    results = []
+def fetch_bond_yields(close):
+    """Compute bond yield changes from pre-fetched closing prices."""
+    bonds = [(sym, label) for sym, label in BOND_TICKERS if sym in close.columns]
+    if not bonds:
+        return []
 
-    bond_map = {
-        "^TNX": "US 10-Year",
-        "^TYX": "US 30-Year",
-    }
+    packed, n_obs = pack_prices(close, [sym for sym, _ in bonds])
+    current = packed[-1]
+    # Changes in bps; 0 when there isn't enough history, as before
+    day_chg, week_chg, month_chg = (
+        np.nan_to_num((current - days_back(packed, n_obs, days)) * 100)
+        for days in (1, 5, 21)
+    )
 
-    for sym, label in bond_map.items():
-        if sym not in close.columns:
-            continue
-        s = close[sym].dropna()
-        if len(s) < 2:
+    results = []
+    for i, (sym, label) in enumerate(bonds):
+        if n_obs[i] < 2:
             continue
-        current = s.iloc[-1]
-        day_chg = (s.iloc[-1] - s.iloc[-2]) * 100 if len(s) >= 2 else 0  # in bps
-        week_chg = (s.iloc[-1] - s.iloc[-6]) * 100 if len(s) >= 6 else 0
-        month_chg = (s.iloc[-1] - s.iloc[-22]) * 100 if len(s) >= 22 else 0
         results.append({
             "Maturity": label,
-            "Yield": f"{current:.2f}%",
-            "1D (bps)": f"{day_chg:+.0f}",
-            "1W (bps)": f"{week_chg:+.0f}",
-            "1M (bps)": f"{month_chg:+.0f}",
+            "Yield": f"{current[i]:.2f}%",
+            "1D (bps)": f"{day_chg[i]:+.0f}",
+            "1W (bps)": f"{week_chg[i]:+.0f}",
+            "1M (bps)": f"{month_chg[i]:+.0f}",
         })
 
-    if two_yr_close is not None and not two_yr_close.empty:
-        s = two_yr_close.squeeze().dropna() if isinstance(two_yr_close, pd.DataFrame) else two_yr_close.dropna()
-        if len(s) >= 2:
-            current = s.iloc[-1]
-            day_chg = (s.iloc[-1] - s.iloc[-2]) * 100
-            week_chg = (s.iloc[-1] - s.iloc[-6]) * 100 if len(s) >= 6 else 0
-            month_chg = (s.iloc[-1] - s.iloc[-22]) * 100 if len(s) >= 22 else 0
-            results.insert(0, {
-                "Maturity": "US 2-Year",
-                "Yield": f"{current:.2f}%",
-                "1D (bps)": f"{day_chg:+.0f}",
-                "1W (bps)": f"{week_chg:+.0f}",
-                "1M (bps)": f"{month_chg:+.0f}",
-            })
-
     return results
 
 
-def fetch_metals():
-    """Fetch gold and silver spot price changes."""
-    symbols = ["GC=F", "SI=F"]
-    try:
-        data = yf.download(symbols, period="5d", auto_adjust=True, progress=False)
-        if data.empty:
-            return []
-        close = data["Close"]
-    except Exception:
+def fetch_metals(close):
+    """Compute gold and silver spot price changes from pre-fetched closing prices."""
+    metals = [(sym, name) for sym, name in METAL_TICKERS if sym in close.columns]
+    if not metals:
         return []
 
+    packed, n_obs = pack_prices(close, [sym for sym, _ in metals])
+    current = packed[-1]
+    prev = days_back(packed, n_obs, 1)
+    chg = current - prev
+    pct = (chg / prev) * 100
+
     results = []
-    metal_names = {"GC=F": "Gold", "SI=F": "Silver"}
-    for sym in symbols:
-        if sym not in close.columns:
+    for i, (sym, name) in enumerate(metals):
+        if n_obs[i] < 2:
             continue
-        s = close[sym].dropna()
-        if len(s) < 2:
-            continue
-        current = s.iloc[-1]
-        prev = s.iloc[-2]
-        chg = current - prev
-        pct = (chg / prev) * 100
         results.append({
-            "Metal": metal_names.get(sym, sym),
-            "Spot (USD/oz)": f"${current:,.2f}",
-            "24hr Chg": f"{'+' if chg >= 0 else ''}{chg:,.2f}",
-            "24hr %": f"{'+' if pct >= 0 else ''}{pct:.2f}%",
+            "Metal": name,
+            "Spot (USD/oz)": PRICE_FMT(current[i]),
+            "24hr Chg": f"{'+' if chg[i] >= 0 else ''}{chg[i]:,.2f}",
+            "24hr %": f"{'+' if pct[i] >= 0 else ''}{pct[i]:.2f}%",
         })
     return results
 
 
 # ─── PDF Generation ──────────────────────────────────────────────────────────
 
+# zlib-compress page streams: ~4x smaller attachment for a negligible build cost
+PDF_PAGE_COMPRESSION = 1
+
+POS_COLOR = colors.Color(0, 0.38, 0)
+NEG_COLOR = colors.Color(0.61, 0, 0.024)
+NEUTRAL_COLOR = colors.grey
+HEADER_BLUE = colors.HexColor("#1F4E79")
+GRID_GREY = colors.HexColor("#D0D0D0")
+ROW_STRIPE = colors.HexColor("#F5F7FA")
+
+
+def _build_styles():
+    """Sample stylesheet plus the report's own paragraph styles."""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        "Title2", parent=styles["Title"], fontSize=18,
+        textColor=HEADER_BLUE, spaceAfter=2
+    ))
+    styles.add(ParagraphStyle(
+        "Subtitle", parent=styles["Normal"], fontSize=9,
+        textColor=colors.grey, spaceAfter=10, alignment=TA_CENTER
+    ))
+    styles.add(ParagraphStyle(
+        "SectionHead", parent=styles["Heading2"], fontSize=11,
+        textColor=HEADER_BLUE, spaceBefore=12, spaceAfter=4
+    ))
+    styles.add(ParagraphStyle(
+        "SmallNote", parent=styles["Normal"], fontSize=7.5,
+        textColor=colors.grey, spaceBefore=6
+    ))
+    return styles
+
+
+STYLES = _build_styles()
+
+
+RETURNS_COL_WIDTHS = [62, 105, 48, 42, 42, 42, 42, 42, 42, 42]  # 509pt total, fits A4 510pt
+VIX_COL_WIDTHS = [42, 140, 50, 62, 62, 57, 57]  # 470 total
+WTI_FUTURES_COL_WIDTHS = [80, 130, 75, 75, 75]  # 435 total
+BOND_COL_WIDTHS = [70, 55, 55, 55, 55]
+METAL_COL_WIDTHS = [60, 80, 65, 65]
+
+JAPAN_YIELD_NOTE = (
+    "Note: Japan 10-Year yield (~2.10%) sourced from TradingEconomics. "
+    "Yahoo Finance does not provide a reliable JGB ticker."
+)
+FOOTER_NOTE = (
+    "Data source: Yahoo Finance (yfinance). Returns are price-only approximations. "
+    "Bond yield changes in basis points. This report is auto-generated and not financial advice."
+)
+
+# Fixed table styles; per-cell TEXTCOLOR overrides are appended per table
+RETURNS_BASE_STYLE_CMDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), HEADER_BLUE),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 7.5),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 1), (-1, -1), 7.5),
+    ("ALIGN", (2, 0), (-1, -1), "CENTER"),
+    ("ALIGN", (0, 0), (1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.4, GRID_GREY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_STRIPE]),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+]
+
+VIX_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4A235A")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("ALIGN", (2, 0), (-1, -1), "CENTER"),
+    ("ALIGN", (0, 0), (1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.4, GRID_GREY),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+])
+
+WTI_FUTURES_BASE_STYLE_CMDS = [
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#5C4033")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("ALIGN", (2, 0), (-1, -1), "CENTER"),
+    ("ALIGN", (0, 0), (1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.4, GRID_GREY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FFF3E0")]),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+]
+
+BOND_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2E75B6")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+    ("GRID", (0, 0), (-1, -1), 0.4, GRID_GREY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, ROW_STRIPE]),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+])
+
+METAL_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#BF8F00")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("ALIGN", (1, 0), (-1, -1), "CENTER"),
+    ("GRID", (0, 0), (-1, -1), 0.4, GRID_GREY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FFF8E1")]),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+])
+
+
 def color_cell(val):
     """Return green/red color for positive/negative values."""
-    if val is None or pd.isna(val):
-        return colors.grey
-    return colors.Color(0, 0.38, 0) if val >= 0 else colors.Color(0.61, 0, 0.024)
+    if val is None or val != val:  # NaN is the only value unequal to itself
+        return NEUTRAL_COLOR
+    return POS_COLOR if val >= 0 else NEG_COLOR
 
 
 def fmt_pct(val):
     """Format percentage for display."""
-    if val is None or (isinstance(val, float) and np.isnan(val)):
-        return "—"
-    return f"{val:+.2%}"
+    return "—" if val is None or val != val else PCT_FMT(val)
+
+
+def returns_rows(df):
+    """Header and formatted rows for a returns table, plus ((col, row), color) per return cell."""
+    headers = ["Ticker", "Name", "Price"] + RETURN_COLS
+
+    # Format whole columns at once rather than row by row via iterrows()
+    price_col = df["Price"].map(PRICE_FMT).where(df["Price"].notna(), "—")
+    rets = df[RETURN_COLS].to_numpy(dtype=float)
+    pct_rows = [[fmt_pct(v) for v in row] for row in rets.tolist()]
+    table_data = [headers] + [
+        [ticker, name, price, *pcts]
+        for ticker, name, price, pcts in zip(df["Ticker"], df["Name"], price_col, pct_rows)
+    ]
+
+    positive = rets >= 0
+    cell_colors = [
+        ((c + 3, r + 1), POS_COLOR if positive[r, c] else NEG_COLOR)
+        for r, c in np.argwhere(~np.isnan(rets)).tolist()
+    ]
+    return table_data, cell_colors
+
+
+def vix_rows(vix):
+    """Header and single data row for the VIX table."""
+    headers = ["Ticker", "Name", "Close", "Intraday High", "Intraday Low", "52W High", "52W Low"]
+    data_row = [
+        vix["Ticker"],
+        vix["Name"],
+        f"{vix['Close']:.2f}",
+        f"{vix['Intraday High']:.2f}",
+        f"{vix['Intraday Low']:.2f}",
+        f"{vix['52W High']:.2f}",
+        f"{vix['52W Low']:.2f}",
+    ]
+    return [headers, data_row]
+
+
+def wti_futures_rows(futures):
+    """Header and rows for the WTI futures table, plus ((col, row), color) per change cell."""
+    headers = ["Contract", "Description", "Price (USD)", "1D Chg ($)", "1D Chg (%)"]
+    table_data = [headers]
+    cell_colors = []
+
+    for row_idx, row in enumerate(futures, start=1):
+        price = row["Price"]
+        chg_d = row["1D Chg ($)"]
+        chg_pct = row["1D Chg (%)"]
+        for col_idx, val in ((3, chg_d), (4, chg_pct)):
+            if val is not None:
+                cell_colors.append(((col_idx, row_idx), color_cell(val)))
+        table_data.append([
+            row["Contract"],
+            row["Description"],
+            PRICE_FMT(price) if price is not None else "—",
+            (f"{'+' if chg_d >= 0 else ''}{chg_d:.2f}" if chg_d is not None else "—"),
+            fmt_pct(chg_pct) if chg_pct is not None else "—",
+        ])
+
+    return table_data, cell_colors
+
+
+def records_rows(records):
+    """Header and rows for a table of pre-formatted dicts (bonds, metals)."""
+    headers = list(records[0].keys())
+    return [headers] + [[row[k] for k in headers] for row in records]
 
 
 def build_pdf(equity_df, crypto_df, bonds, metals,
@@ -343,83 +600,29 @@ def build_pdf(equity_df, crypto_df, bonds, metals,
     doc = SimpleDocTemplate(
         filename, pagesize=A4,
         leftMargin=15*mm, rightMargin=15*mm,
-        topMargin=15*mm, bottomMargin=15*mm
+        topMargin=15*mm, bottomMargin=15*mm,
+        pageCompression=PDF_PAGE_COMPRESSION,
     )
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(
-        "Title2", parent=styles["Title"], fontSize=18,
-        textColor=colors.HexColor("#1F4E79"), spaceAfter=2
-    ))
-    styles.add(ParagraphStyle(
-        "Subtitle", parent=styles["Normal"], fontSize=9,
-        textColor=colors.grey, spaceAfter=10, alignment=TA_CENTER
-    ))
-    styles.add(ParagraphStyle(
-        "SectionHead", parent=styles["Heading2"], fontSize=11,
-        textColor=colors.HexColor("#1F4E79"), spaceBefore=12, spaceAfter=4
-    ))
-    styles.add(ParagraphStyle(
-        "SmallNote", parent=styles["Normal"], fontSize=7.5,
-        textColor=colors.grey, spaceBefore=6
-    ))
-
     story = []
 
     # ── Title ──
-    story.append(Paragraph("Daily Market Dashboard", styles["Title2"]))
-    story.append(Paragraph(f"{date_str} &nbsp;|&nbsp; Generated at {time_str}", styles["Subtitle"]))
-    story.append(HRFlowable(width="100%", color=colors.HexColor("#1F4E79"), thickness=1.5))
+    story.append(Paragraph("Daily Market Dashboard", STYLES["Title2"]))
+    story.append(Paragraph(f"{date_str} &nbsp;|&nbsp; Generated at {time_str}", STYLES["Subtitle"]))
+    story.append(HRFlowable(width="100%", color=HEADER_BLUE, thickness=1.5))
     story.append(Spacer(1, 6))
 
     # ── Helper: standard returns table (Ticker/Name/Price/1D-3Y) ──
     def make_returns_table(df, section_title):
-        story.append(Paragraph(section_title, styles["SectionHead"]))
-
-        headers = ["Ticker", "Name", "Price", "1D", "1W", "1M", "3M", "6M", "1Y", "3Y"]
-        table_data = [headers]
-
-        for _, row in df.iterrows():
-            table_data.append([
-                row["Ticker"],
-                row["Name"],
-                f"${row['Price']:,.2f}" if pd.notna(row.get("Price")) else "—",
-                fmt_pct(row.get("1D")),
-                fmt_pct(row.get("1W")),
-                fmt_pct(row.get("1M")),
-                fmt_pct(row.get("3M")),
-                fmt_pct(row.get("6M")),
-                fmt_pct(row.get("1Y")),
-                fmt_pct(row.get("3Y")),
-            ])
-
-        col_widths = [62, 105, 48, 42, 42, 42, 42, 42, 42, 42]  # 509pt total, fits A4 510pt
-        t = Table(table_data, colWidths=col_widths, repeatRows=1)
-
-        style_cmds = [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1F4E79")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 7.5),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("FONTSIZE", (0, 1), (-1, -1), 7.5),
-            ("ALIGN", (2, 0), (-1, -1), "CENTER"),
-            ("ALIGN", (0, 0), (1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#D0D0D0")),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F5F7FA")]),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ]
+        story.append(Paragraph(section_title, STYLES["SectionHead"]))
 
-        # Color-code return cells
-        for row_idx in range(1, len(table_data)):
-            for col_idx in range(3, 10):
-                period_key = headers[col_idx]
-                val = df.iloc[row_idx - 1].get(period_key)
-                if val is not None and not (isinstance(val, float) and np.isnan(val)):
-                    c = color_cell(val)
-                    style_cmds.append(("TEXTCOLOR", (col_idx, row_idx), (col_idx, row_idx), c))
+        table_data, cell_colors = returns_rows(df)
+        t = Table(table_data, colWidths=RETURNS_COL_WIDTHS, repeatRows=1)
+
+        # Color-code return cells on top of the shared base style
+        style_cmds = RETURNS_BASE_STYLE_CMDS + [
+            ("TEXTCOLOR", cell, cell, color) for cell, color in cell_colors
+        ]
 
         t.setStyle(TableStyle(style_cmds))
         story.append(t)
@@ -427,84 +630,24 @@ def build_pdf(equity_df, crypto_df, bonds, metals,
 
     # ── Helper: VIX table ──
     def make_vix_table(vix):
-        story.append(Paragraph("Volatility — VIX Index (^VIX)", styles["SectionHead"]))
-        headers = ["Ticker", "Name", "Close", "Intraday High", "Intraday Low", "52W High", "52W Low"]
-        data_row = [
-            vix["Ticker"],
-            vix["Name"],
-            f"{vix['Close']:.2f}",
-            f"{vix['Intraday High']:.2f}",
-            f"{vix['Intraday Low']:.2f}",
-            f"{vix['52W High']:.2f}",
-            f"{vix['52W Low']:.2f}",
-        ]
-        table_data = [headers, data_row]
-        col_widths = [42, 140, 50, 62, 62, 57, 57]  # 470 total
-        t = Table(table_data, colWidths=col_widths, repeatRows=1)
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4A235A")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("ALIGN", (2, 0), (-1, -1), "CENTER"),
-            ("ALIGN", (0, 0), (1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#D0D0D0")),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ]))
+        story.append(Paragraph("Volatility — VIX Index (^VIX)", STYLES["SectionHead"]))
+        t = Table(vix_rows(vix), colWidths=VIX_COL_WIDTHS, repeatRows=1)
+        t.setStyle(VIX_STYLE)
         story.append(t)
         story.append(Spacer(1, 4))
 
     # ── Helper: WTI futures term structure table ──
     def make_wti_futures_table(futures):
-        story.append(Paragraph("WTI Crude Oil — Futures Term Structure", styles["SectionHead"]))
+        story.append(Paragraph("WTI Crude Oil — Futures Term Structure", STYLES["SectionHead"]))
         if not futures:
-            story.append(Paragraph("No futures data available.", styles["SmallNote"]))
+            story.append(Paragraph("No futures data available.", STYLES["SmallNote"]))
             return
 
-        headers = ["Contract", "Description", "Price (USD)", "1D Chg ($)", "1D Chg (%)"]
-        table_data = [headers]
-        sign_data = {}  # row_idx -> {col_idx: val} for coloring
-
-        for i, row in enumerate(futures):
-            price = row["Price"]
-            chg_d = row["1D Chg ($)"]
-            chg_pct = row["1D Chg (%)"]
-            sign_data[i + 1] = {3: chg_d, 4: chg_pct}
-            table_data.append([
-                row["Contract"],
-                row["Description"],
-                f"${price:,.2f}" if price is not None else "—",
-                (f"{'+' if chg_d >= 0 else ''}{chg_d:.2f}" if chg_d is not None else "—"),
-                fmt_pct(chg_pct) if chg_pct is not None else "—",
-            ])
-
-        col_widths = [80, 130, 75, 75, 75]  # 435 total
-        t = Table(table_data, colWidths=col_widths, repeatRows=1)
-
-        style_cmds = [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#5C4033")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("ALIGN", (2, 0), (-1, -1), "CENTER"),
-            ("ALIGN", (0, 0), (1, -1), "LEFT"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#D0D0D0")),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FFF3E0")]),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ]
-        for row_idx, cols in sign_data.items():
-            for col_idx, val in cols.items():
-                if val is not None:
-                    style_cmds.append(
-                        ("TEXTCOLOR", (col_idx, row_idx), (col_idx, row_idx), color_cell(val))
-                    )
-        t.setStyle(TableStyle(style_cmds))
+        table_data, cell_colors = wti_futures_rows(futures)
+        t = Table(table_data, colWidths=WTI_FUTURES_COL_WIDTHS, repeatRows=1)
+        t.setStyle(TableStyle(WTI_FUTURES_BASE_STYLE_CMDS + [
+            ("TEXTCOLOR", cell, cell, color) for cell, color in cell_colors
+        ]))
         story.append(t)
         story.append(Spacer(1, 4))
 
@@ -546,66 +689,185 @@ def build_pdf(equity_df, crypto_df, bonds, metals,
 
     # ── Bond Yields ──
     if bonds:
-        story.append(Paragraph("US Treasury & Japan Bond Yields", styles["SectionHead"]))
-        bond_headers = list(bonds[0].keys())
-        bond_data = [bond_headers] + [[row[k] for k in bond_headers] for row in bonds]
-
-        bt = Table(bond_data, colWidths=[70, 55, 55, 55, 55], repeatRows=1)
-        bt.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2E75B6")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#D0D0D0")),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F5F7FA")]),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ]))
+        story.append(Paragraph("US Treasury & Japan Bond Yields", STYLES["SectionHead"]))
+        bt = Table(records_rows(bonds), colWidths=BOND_COL_WIDTHS, repeatRows=1)
+        bt.setStyle(BOND_STYLE)
         story.append(bt)
-        story.append(Paragraph(
-            "Note: Japan 10-Year yield (~2.10%) sourced from TradingEconomics. "
-            "Yahoo Finance does not provide a reliable JGB ticker.",
-            styles["SmallNote"]
-        ))
+        story.append(Paragraph(JAPAN_YIELD_NOTE, STYLES["SmallNote"]))
         story.append(Spacer(1, 4))
 
     # ── Precious Metals ──
     if metals:
-        story.append(Paragraph("Precious Metals — 24hr Spot Price Moves", styles["SectionHead"]))
-        metal_headers = list(metals[0].keys())
-        metal_data = [metal_headers] + [[row[k] for k in metal_headers] for row in metals]
-
-        mt = Table(metal_data, colWidths=[60, 80, 65, 65], repeatRows=1)
-        mt.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#BF8F00")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ("ALIGN", (1, 0), (-1, -1), "CENTER"),
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#D0D0D0")),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FFF8E1")]),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ]))
+        story.append(Paragraph("Precious Metals — 24hr Spot Price Moves", STYLES["SectionHead"]))
+        mt = Table(records_rows(metals), colWidths=METAL_COL_WIDTHS, repeatRows=1)
+        mt.setStyle(METAL_STYLE)
         story.append(mt)
         story.append(Spacer(1, 6))
 
     # ── Footer ──
-    story.append(HRFlowable(width="100%", color=colors.HexColor("#D0D0D0"), thickness=0.5))
-    story.append(Paragraph(
-        "Data source: Yahoo Finance (yfinance). Returns are price-only approximations. "
-        "Bond yield changes in basis points. This report is auto-generated and not financial advice.",
-        styles["SmallNote"]
-    ))
+    story.append(HRFlowable(width="100%", color=GRID_GREY, thickness=0.5))
+    story.append(Paragraph(FOOTER_NOTE, STYLES["SmallNote"]))
 
     doc.build(story)
     print(f"PDF saved: {filename}")
     return filename
 
 
+# ─── Fast PDF Generation ─────────────────────────────────────────────────────
+# Draws tables straight onto a canvas at fixed column offsets, skipping the
+# platypus Table layout pass, whose cost grows with every cell measured.
+
+FAST_PDF_MIN_ROWS = 200  # returns-table rows at which the "auto" renderer switches to canvas
+PDF_RENDERERS = ("auto", "platypus", "canvas")
+PAGE_MARGIN = 15 * mm
+
+
+def _new_page_if_needed(c, y, needed):
+    """Start a new page if fewer than `needed` points remain above the bottom margin."""
+    if y - needed < PAGE_MARGIN:
+        c.showPage()
+        return A4[1] - PAGE_MARGIN
+    return y
+
+
+def _draw_note(c, y, text, font_size=7.5):
+    """Draw a wrapped grey note; return the y below it."""
+    lines = simpleSplit(text, "Helvetica", font_size, A4[0] - 2 * PAGE_MARGIN)
+    y = _new_page_if_needed(c, y - 6, len(lines) * (font_size + 2))
+    c.setFont("Helvetica", font_size)
+    c.setFillColor(colors.grey)
+    for line in lines:
+        y -= font_size + 2
+        c.drawString(PAGE_MARGIN, y, line)
+    return y
+
+
+def _draw_table(c, y, title, table_data, col_widths, header_color, stripe_color=None,
+                cell_colors=(), left_cols=2, font_size=7.5):
+    """Draw a section heading and grid table top-down from y; return the y below it."""
+    row_h = font_size + 6
+    xs = (A4[0] - sum(col_widths)) / 2 + np.concatenate(([0], np.cumsum(col_widths)))
+    width = xs[-1] - xs[0]
+    text_colors = dict(cell_colors)
+
+    def draw_row(y, row_idx):
+        if row_idx == 0:
+            fill = header_color
+        else:
+            fill = stripe_color if stripe_color is not None and row_idx % 2 == 0 else colors.white
+        c.setFillColor(fill)
+        c.setStrokeColor(GRID_GREY)
+        c.setLineWidth(0.4)
+        c.rect(xs[0], y - row_h, width, row_h, stroke=1, fill=1)
+        for x in xs[1:-1]:
+            c.line(x, y - row_h, x, y)
+
+        c.setFont("Helvetica-Bold" if row_idx == 0 else "Helvetica", font_size)
+        baseline = y - row_h + 4
+        for col_idx, cell in enumerate(table_data[row_idx]):
+            if row_idx == 0:
+                c.setFillColor(colors.white)
+            else:
+                c.setFillColor(text_colors.get((col_idx, row_idx), colors.black))
+            if col_idx < left_cols:
+                c.drawString(xs[col_idx] + 3, baseline, str(cell))
+            else:
+                c.drawCentredString((xs[col_idx] + xs[col_idx + 1]) / 2, baseline, str(cell))
+        return y - row_h
+
+    # Keep the heading with the header row and first data row
+    y = _new_page_if_needed(c, y - 12, 16 + 2 * row_h)
+    c.setFont("Helvetica-Bold", 11)
+    c.setFillColor(HEADER_BLUE)
+    c.drawString(PAGE_MARGIN, y - 11, title)
+    y = draw_row(y - 16, 0)
+
+    for row_idx in range(1, len(table_data)):
+        if y - row_h < PAGE_MARGIN:
+            c.showPage()
+            y = draw_row(A4[1] - PAGE_MARGIN, 0)  # repeat header row
+        y = draw_row(y, row_idx)
+    return y - 4
+
+
+def build_pdf_fast(equity_df, crypto_df, bonds, metals,
+                   mag7_df=None, defense_df=None, global_df=None,
+                   currency_df=None, wti_df=None, wti_futures=None,
+                   vix_data=None, filename="market_report.pdf"):
+    """Build the same report as build_pdf, drawing directly on a canvas."""
+    now = datetime.utcnow() + timedelta(hours=8)  # SGT
+    date_str = now.strftime("%A, %B %d, %Y")
+    time_str = now.strftime("%I:%M %p SGT")
+    page_w, page_h = A4
+
+    c = canvas.Canvas(filename, pagesize=A4, pageCompression=PDF_PAGE_COMPRESSION)
+
+    # ── Title ──
+    y = page_h - PAGE_MARGIN
+    c.setFont("Helvetica-Bold", 18)
+    c.setFillColor(HEADER_BLUE)
+    c.drawCentredString(page_w / 2, y - 18, "Daily Market Dashboard")
+    c.setFont("Helvetica", 9)
+    c.setFillColor(colors.grey)
+    c.drawCentredString(page_w / 2, y - 34, f"{date_str}  |  Generated at {time_str}")
+    y -= 44
+    c.setStrokeColor(HEADER_BLUE)
+    c.setLineWidth(1.5)
+    c.line(PAGE_MARGIN, y, page_w - PAGE_MARGIN, y)
+    y -= 6
+
+    returns_sections = [
+        (global_df, "Global Market Indices"),
+        (currency_df, "Currency Moves"),
+        (equity_df, "Equity & Sector ETF Returns"),
+        (mag7_df, "Magnificent 7 — Stock Returns"),
+        (defense_df, "Defense & Aerospace ETFs (KDEF · ITA)"),
+        (crypto_df, "Cryptocurrency Returns"),
+    ]
+    for df, title in returns_sections:
+        if df is not None and not df.empty:
+            table_data, cell_colors = returns_rows(df)
+            y = _draw_table(c, y, title, table_data, RETURNS_COL_WIDTHS,
+                            HEADER_BLUE, ROW_STRIPE, cell_colors)
+
+    if vix_data:
+        y = _draw_table(c, y, "Volatility — VIX Index (^VIX)", vix_rows(vix_data),
+                        VIX_COL_WIDTHS, colors.HexColor("#4A235A"), font_size=8)
+
+    if wti_df is not None and not wti_df.empty:
+        table_data, cell_colors = returns_rows(wti_df)
+        y = _draw_table(c, y, "WTI Crude Oil — Price Returns", table_data, RETURNS_COL_WIDTHS,
+                        HEADER_BLUE, ROW_STRIPE, cell_colors)
+
+    if wti_futures:
+        table_data, cell_colors = wti_futures_rows(wti_futures)
+        y = _draw_table(c, y, "WTI Crude Oil — Futures Term Structure", table_data,
+                        WTI_FUTURES_COL_WIDTHS, colors.HexColor("#5C4033"),
+                        colors.HexColor("#FFF3E0"), cell_colors, font_size=8)
+
+    if bonds:
+        y = _draw_table(c, y, "US Treasury & Japan Bond Yields", records_rows(bonds),
+                        BOND_COL_WIDTHS, colors.HexColor("#2E75B6"), ROW_STRIPE,
+                        left_cols=1, font_size=8)
+        y = _draw_note(c, y, JAPAN_YIELD_NOTE)
+
+    if metals:
+        y = _draw_table(c, y, "Precious Metals — 24hr Spot Price Moves", records_rows(metals),
+                        METAL_COL_WIDTHS, colors.HexColor("#BF8F00"),
+                        colors.HexColor("#FFF8E1"), left_cols=1, font_size=8)
+
+    # ── Footer ──
+    y = _new_page_if_needed(c, y - 6, 20)
+    c.setStrokeColor(GRID_GREY)
+    c.setLineWidth(0.5)
+    c.line(PAGE_MARGIN, y, page_w - PAGE_MARGIN, y)
+    _draw_note(c, y, FOOTER_NOTE)
+
+    c.save()
+    print(f"PDF saved: {filename}")
+    return filename
+
+
 # ─── Telegram Sending ────────────────────────────────────────────────────────
 
 def send_telegram(pdf_path):
@@ -654,67 +916,107 @@ def send_telegram(pdf_path):
 
 # ─── Main ────────────────────────────────────────────────────────────────────
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and send the daily market dashboard PDF.")
+    parser.add_argument(
+        "--renderer", choices=PDF_RENDERERS,
+        default=os.environ.get("PDF_RENDERER", "auto"),
+        help="PDF builder (default: $PDF_RENDERER or auto, which picks canvas "
+             f"from {FAST_PDF_MIN_ROWS} returns rows)",
+    )
+    parser.add_argument(
+        "--smoke", action="store_true",
+        help="after sending, also build market_report_platypus.pdf and "
+             "market_report_canvas.pdf from the same data",
+    )
+    args = parser.parse_args(argv)
+    # argparse doesn't check defaults against choices, so vet $PDF_RENDERER here
+    if args.renderer not in PDF_RENDERERS:
+        parser.error(f"PDF_RENDERER must be one of {', '.join(PDF_RENDERERS)}, got {args.renderer!r}")
+
     print("=" * 60)
     print("DAILY MARKET DASHBOARD GENERATOR")
     print(f"Run time: {(datetime.utcnow() + timedelta(hours=8)).strftime('%Y-%m-%d %H:%M SGT')}")
     print("=" * 60)
 
-    print("\n[1/11] Fetching equity & sector data...")
-    equity_df = fetch_returns(EQUITY_TICKERS)
-    print(f"  → {len(equity_df)} tickers fetched")
+    # Older yfinance collects yf.download() results in a module-global dict
+    # that a failed Ticker.history() also writes to, so the batched download
+    # must finish before the VIX and WTI futures fetches start. Those two are
+    # independent network-bound calls, so overlap them.
+    close = cached_fetch("close", fetch_close_prices, close_is_complete)
+    print(f"\n[1/3] Price history → {close.shape[1]} symbols fetched")
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        f_vix = ex.submit(cached_fetch, "vix", fetch_vix_data)
+        f_wti_futures = ex.submit(
+            cached_fetch, "wti_futures", fetch_wti_futures, wti_futures_is_complete
+        )
+
+        vix_data = f_vix.result()
+        print(f"[2/3] VIX data → {'fetched' if vix_data else 'unavailable'}")
 
-    print("[2/11] Fetching Magnificent 7 stocks...")
-    mag7_df = fetch_returns(MAG7_TICKERS)
-    print(f"  → {len(mag7_df)} tickers fetched")
+        wti_futures = f_wti_futures.result()
+        print(f"[3/3] WTI futures term structure → {len(wti_futures)} contracts fetched")
 
-    print("[3/11] Fetching defense ETFs (KDEF, ITA)...")
-    defense_df = fetch_returns(DEFENSE_TICKERS)
-    print(f"  → {len(defense_df)} tickers fetched")
+    print("\nComputing returns...")
+    equity_df = fetch_returns(EQUITY_TICKERS, close)
+    print(f"  → Equity & sector: {len(equity_df)} tickers")
 
-    print("[4/11] Fetching global market indices...")
-    global_df = fetch_returns(GLOBAL_INDEX_TICKERS)
-    print(f"  → {len(global_df)} indices fetched")
+    mag7_df = fetch_returns(MAG7_TICKERS, close)
+    print(f"  → Magnificent 7: {len(mag7_df)} tickers")
 
-    print("[5/11] Fetching currency moves...")
-    currency_df = fetch_returns(CURRENCY_TICKERS)
-    print(f"  → {len(currency_df)} pairs fetched")
+    defense_df = fetch_returns(DEFENSE_TICKERS, close)
+    print(f"  → Defense ETFs: {len(defense_df)} tickers")
 
-    print("[6/11] Fetching crypto data...")
-    crypto_df = fetch_returns(CRYPTO_TICKERS, period="5y")
-    print(f"  → {len(crypto_df)} tickers fetched")
+    global_df = fetch_returns(GLOBAL_INDEX_TICKERS, close)
+    print(f"  → Global indices: {len(global_df)} indices")
 
-    print("[7/11] Fetching VIX data...")
-    vix_data = fetch_vix_data()
-    print(f"  → {'fetched' if vix_data else 'unavailable'}")
+    currency_df = fetch_returns(CURRENCY_TICKERS, close)
+    print(f"  → Currencies: {len(currency_df)} pairs")
 
-    print("[8/11] Fetching WTI crude returns...")
-    wti_df = fetch_returns(WTI_TICKERS)
-    print(f"  → {len(wti_df)} tickers fetched")
+    crypto_df = fetch_returns(CRYPTO_TICKERS, close)
+    print(f"  → Crypto: {len(crypto_df)} tickers")
 
-    print("[9/11] Fetching WTI futures term structure...")
-    wti_futures = fetch_wti_futures()
-    print(f"  → {len(wti_futures)} contracts fetched")
+    wti_df = fetch_returns(WTI_TICKERS, close)
+    print(f"  → WTI crude: {len(wti_df)} tickers")
 
-    print("[10/11] Fetching bond yields...")
-    bonds = fetch_bond_yields()
-    print(f"  → {len(bonds)} bond maturities fetched")
+    bonds = fetch_bond_yields(close)
+    print(f"  → Bond yields: {len(bonds)} maturities")
 
-    print("[11/11] Fetching precious metals...")
-    metals = fetch_metals()
-    print(f"  → {len(metals)} metals fetched")
+    metals = fetch_metals(close)
+    print(f"  → Precious metals: {len(metals)} metals")
 
-    print("\nGenerating PDF report...")
-    pdf_path = build_pdf(
-        equity_df, crypto_df, bonds, metals,
+    pdf_args = (equity_df, crypto_df, bonds, metals)
+    pdf_kwargs = dict(
         mag7_df=mag7_df, defense_df=defense_df, global_df=global_df,
         currency_df=currency_df, wti_df=wti_df, wti_futures=wti_futures,
         vix_data=vix_data,
     )
 
+    renderer = args.renderer
+    if renderer == "auto":
+        n_rows = sum(len(df) for df in (
+            equity_df, mag7_df, defense_df, global_df, currency_df, crypto_df, wti_df
+        ))
+        renderer = "canvas" if n_rows >= FAST_PDF_MIN_ROWS else "platypus"
+
+    print(f"\nGenerating PDF report ({renderer})...")
+    builder = build_pdf_fast if renderer == "canvas" else build_pdf
+    pdf_path = builder(*pdf_args, **pdf_kwargs)
+
     print("\nSending to Telegram...")
     send_telegram(pdf_path)
 
+    if args.smoke:
+        # Reuses the data fetched above; a failure here shouldn't fail a run
+        # whose report was already sent
+        print("\nSmoke test: building the report with both renderers...")
+        for name, smoke_builder in (("platypus", build_pdf), ("canvas", build_pdf_fast)):
+            try:
+                smoke_builder(*pdf_args, filename=f"market_report_{name}.pdf", **pdf_kwargs)
+            except Exception as e:
+                print(f"Smoke test failed ({name}): {e}")
+
     print("\nDone!")
 
 